@@ -197,7 +197,7 @@ def main():
         with col1:
             flow_type = st.selectbox(
                 "Select Flow Type", 
-                [flow.value for flow in FlowType]
+                [flow.label for flow in FlowType]
             )
         
         with col2:
@@ -263,7 +263,7 @@ def main():
             try:
                 results = run_feature_test(
                     feature_text=st.session_state.feature_text,
-                    flow_type=FlowType(st.session_state.flow_type),
+                    flow_type=FlowType.from_label(st.session_state.flow_type),
                     image_path=st.session_state.get('image_path'),
                     persona_names=st.session_state.personas
                 )
@@ -1,22 +1,137 @@
 import chromadb
+import numpy as np
 from chromadb.config import Settings
+from chromadb.utils import embedding_functions
 import os
 import logging
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 import traceback
 
 
 logger = logging.getLogger(__name__)
 
+# HNSW index settings applied when a collection is first created
+HNSW_CONFIG = {
+    "hnsw:space": "cosine",
+    "hnsw:construction_ef": 200,
+    "hnsw:search_ef": 64,
+    "hnsw:M": 32,
+}
+
+# Writes from another process are not seen until cached entries expire after ttl_seconds
+DEFAULT_CACHE_CONFIG = {"max_size": 2000, "ttl_seconds": 600}
+
+
+class QueryCache:
+    """Thread-safe LRU cache with a per-entry TTL for collection query results"""
+
+    def __init__(self, max_size: int = 2000, ttl_seconds: float = 600):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(query_text: str, n_results: int, include: Optional[List[str]] = None) -> str:
+        key = f"{n_results}\x00{','.join(include or [])}\x00{query_text}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Dict) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# One query cache per database directory, shared by every ChromaDBManager opened on it,
+# so documents added through one manager invalidate cached results for all of them
+_QUERY_CACHES: Dict[str, QueryCache] = {}
+_QUERY_CACHES_LOCK = threading.Lock()
+
+
+def _shared_query_cache(persist_directory: str, cache_config: Optional[Dict] = None) -> QueryCache:
+    """The query cache for a database directory, created with cache_config by its first manager"""
+    with _QUERY_CACHES_LOCK:
+        cache = _QUERY_CACHES.get(persist_directory)
+        if cache is None:
+            cache = _QUERY_CACHES[persist_directory] = QueryCache(**{**DEFAULT_CACHE_CONFIG, **(cache_config or {})})
+        return cache
+
+
+def mmr_rerank(query_embedding, embeddings, k: int, lambda_mult: float = 0.5) -> List[int]:
+    """
+    Select k diverse, relevant rows with Maximal Marginal Relevance
+
+    Args:
+        query_embedding: Embedding of the query
+        embeddings: Candidate embeddings, one row per document
+        k: Number of rows to select
+        lambda_mult: Trade-off between relevance (1.0) and diversity (0.0)
+
+    Returns:
+        Indices of the selected rows in selection order
+    """
+    E = np.asarray(embeddings, dtype=np.float32)
+    q = np.asarray(query_embedding, dtype=np.float32)
+    if E.ndim != 2 or len(E) == 0:
+        return []
+
+    # Normalise once so every dot product below is a cosine similarity
+    E = E / np.maximum(np.linalg.norm(E, axis=1, keepdims=True), 1e-12)
+    q = q / max(float(np.linalg.norm(q)), 1e-12)
+
+    # Pre-compute all similarities up front
+    sim_to_query = E @ q
+    sim_matrix = E @ E.T
+
+    k = min(k, len(E))
+    available = np.ones(len(E), dtype=bool)
+    max_sim_to_selected = np.full(len(E), -np.inf, dtype=np.float32)
+    selected = []
+    for _ in range(k):
+        if selected:
+            scores = lambda_mult * sim_to_query - (1 - lambda_mult) * max_sim_to_selected
+        else:
+            scores = sim_to_query.copy()
+        scores[~available] = -np.inf
+        idx = int(np.argmax(scores))
+        selected.append(idx)
+        available[idx] = False
+        np.maximum(max_sim_to_selected, sim_matrix[:, idx], out=max_sim_to_selected)
+    return selected
+
 
 class ChromaDBManager:
-    def __init__(self, persist_directory="processed_documents/chroma_db"):
+    def __init__(self, persist_directory="processed_documents/chroma_db", cache_config: Optional[Dict] = None):
         """
         Initialize ChromaDB with persistent storage
         
         Args:
             persist_directory: Directory to store the database
+            cache_config: Query cache settings ("max_size", "ttl_seconds"), used by the
+                first manager opened on persist_directory
         """
         # self.persist_directory = persist_directory
         # Convert to absolute path and make sure it exists
@@ -25,17 +140,38 @@ class ChromaDBManager:
         
         # Initialize ChromaDB client with persistent storage
         self.client = chromadb.PersistentClient(path=self.persist_directory)
+
+        # Chroma's default model, held here so query embeddings can be computed for reranking
+        self.embedding_function = embedding_functions.DefaultEmbeddingFunction()
         
         # Create or get the collection
-        self.collection = self.client.get_or_create_collection(
+        self.collection = self._get_or_create_collection(
             name="conversation_embeddings",
-            metadata={"description": "Processed conversation embeddings and feedback"}
+            description="Processed conversation embeddings and feedback"
         )
+
+        self.query_cache = _shared_query_cache(self.persist_directory, cache_config)
         
         # Verify collection
         logger.info(f"ChromaDB collection initialized at: {persist_directory}")
         logger.info(f"Collection name: {self.collection.name}")
         logger.info(f"Collection count: {self.collection.count()}")
+
+    def _get_or_create_collection(self, name: str, description: str):
+        """
+        Get an existing collection, or create it with the HNSW settings.
+
+        The HNSW settings are only applied on creation since Chroma does not
+        support changing the distance function of an existing index.
+        """
+        try:
+            return self.client.get_collection(name=name, embedding_function=self.embedding_function)
+        except ValueError:
+            return self.client.create_collection(
+                name=name,
+                metadata={"description": description, **HNSW_CONFIG},
+                embedding_function=self.embedding_function
+            )
     
     def add_documents(self, documents, metadatas=None, ids=None, embeddings=None):
         """
@@ -54,29 +190,81 @@ class ChromaDBManager:
                 ids=ids,
                 embeddings=embeddings
             )
+            self.query_cache.clear()
             logger.info(f"Added {len(documents)} documents to collection")
             logger.info(f"New collection count: {self.collection.count()}")
         except Exception as e:
             logger.error(f"Error adding documents to collection: {str(e)}")
             raise
     
-    def query(self, query_text, n_results=5):
+    @staticmethod
+    def _query_input(query_text, query_embedding=None) -> Dict:
+        """Search by the precomputed embedding when given, else let Chroma embed the text"""
+        if query_embedding is None:
+            return {"query_texts": [query_text]}
+        return {"query_embeddings": [np.asarray(query_embedding, dtype=np.float32).tolist()]}
+
+    def query(self, query_text, n_results=5, include=None, query_embedding=None):
         """
         Query the collection
         
         Args:
             query_text: Text to search for
             n_results: Number of results to return
+            include: Fields to return, defaults to Chroma's documents, metadatas and distances
+            query_embedding: Embedding of query_text, to skip embedding it again
             
         Returns:
             Dictionary containing results
         """
+        cache_key = QueryCache.make_key(query_text, n_results, include)
+        results = self.query_cache.get(cache_key)
+        if results is not None:
+            return results
+
         results = self.collection.query(
-            query_texts=[query_text],
-            n_results=n_results
+            **self._query_input(query_text, query_embedding),
+            n_results=n_results,
+            **({"include": include} if include else {})
         )
+        self.query_cache.set(cache_key, results)
         return results
     
+    def query_mmr(self, query_text, n_results=5, fetch_k=20, lambda_mult=0.5):
+        """
+        Retrieve fetch_k candidates and rerank them down to n_results with MMR
+
+        Dropping near-duplicate chunks keeps the retrieved context, and so the
+        prompt, shorter without losing coverage.
+
+        Args:
+            query_text: Text to search for
+            n_results: Number of results to return
+            fetch_k: Number of candidates to retrieve before reranking
+            lambda_mult: Trade-off between relevance (1.0) and diversity (0.0)
+
+        Returns:
+            Dictionary containing results, without embeddings
+        """
+        # Embed once: the same vector drives the search and the reranking
+        query_embedding = self.embedding_function([query_text])[0]
+        candidates = self.query(
+            query_text,
+            n_results=fetch_k,
+            include=["documents", "metadatas", "distances", "embeddings"],
+            query_embedding=query_embedding
+        )
+        embeddings = candidates.get("embeddings")
+        if embeddings is None or len(embeddings[0]) == 0:
+            selected = range(min(n_results, len(candidates["ids"][0])))
+        else:
+            selected = mmr_rerank(query_embedding, embeddings[0], n_results, lambda_mult)
+        return {
+            key: [[values[0][i] for i in selected]]
+            for key, values in candidates.items()
+            if key in ("ids", "documents", "metadatas", "distances") and values is not None
+        }
+    
     def get_context(self, query_text: str, n_results: int = 3) -> Dict:
         """
         Retrieve context from ChromaDB for RAG.
@@ -1,27 +1,66 @@
 import os
 import boto3
+import httpx
 import json
+import threading
+from botocore.config import Config
 from openai import AzureOpenAI
 from handlers.logger import logger
 from model_clients.retry_logic import retry_with_exponential_backoff
 import google.generativeai as genai
 
 
+# Connection pool shared by every Azure OpenAI client so keep-alive connections
+# (and their TLS sessions) are reused across requests and client instances
+_azure_http_client = httpx.Client(
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+)
+
+# Pool and retry settings for Bedrock runtime clients
+_bedrock_config = Config(
+    max_pool_connections=32,
+    retries={"max_attempts": 3, "mode": "standard"}
+)
+
+
+class _PerThreadUsage:
+    """Client attribute holding a separate value per thread, 0 until that thread sets it"""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, client, owner=None):
+        if client is None:
+            return self
+        return getattr(client._usage, self.name, 0)
+
+    def __set__(self, client, value):
+        setattr(client._usage, self.name, value)
+
+
 class BaseModelClient:
-    """Base class for all model clients"""
+    """
+    Base class for all model clients
+
+    Clients are cached and shared across threads, so the last_*_token_usage
+    fields are kept per thread: each reports the last request made by the
+    calling thread.
+    """
+
+    last_token_usage = _PerThreadUsage()
+    last_completion_token_usage = _PerThreadUsage()
+    last_prompt_token_usage = _PerThreadUsage()
 
     def __init__(self, model_name: str):
         self.model_name = model_name
-        self.last_token_usage = 0
-        self.last_completion_token_usage = 0
-        self.last_prompt_token_usage = 0
+        self._usage = threading.local()
 
     def send_request(self, prompt: str, image_base64: str = None) -> str:
         """Send request to model with optional image support"""
         raise NotImplementedError("Subclasses must implement send_request")
 
     def get_token_usage(self) -> int:
-        """Get token usage from last request"""
+        """Get token usage from the calling thread's last request"""
         return self.last_token_usage
 
 
@@ -34,7 +73,8 @@ class AzureOpenAIClient(BaseModelClient):
             self.client = AzureOpenAI(
                 azure_endpoint=os.environ.get("AZURE_OPENAI_ENDPOINT"),
                 api_key=os.environ.get("AZURE_OPENAI_KEY"),
-                api_version=os.environ.get("AZURE_OPENAI_API_VERSION", "2024-02-01")
+                api_version=os.environ.get("AZURE_OPENAI_API_VERSION", "2024-02-01"),
+                http_client=_azure_http_client
             )
             self.deployment_name = model_name  # Make sure model_name is stored as deployment_name
             logger.info(f"Initialized Azure OpenAI client for deployment {model_name}")
@@ -92,7 +132,7 @@ class AWSBedrockClient(BaseModelClient):
     def __init__(self, model_name: str):
         super().__init__(model_name)
         try:
-            self.client = boto3.client('bedrock-runtime', region_name='ap-south-1')
+            self.client = boto3.client('bedrock-runtime', region_name='ap-south-1', config=_bedrock_config)
             logger.info(f"Initialized AWS Bedrock client for model {model_name}")
         except ImportError:
             logger.error("boto3 package not installed. Install with: pip install boto3")
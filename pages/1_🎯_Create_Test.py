@@ -90,7 +90,7 @@ with st.form("test_creation_form"):
     col1, col2 = st.columns(2)
     
     with col1:
-        flow_types = [ft.value for ft in FlowType]
+        flow_types = [ft.label for ft in FlowType]
         flow_type = st.selectbox(
             "Flow Type",
             flow_types,
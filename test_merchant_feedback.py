@@ -1,8 +1,10 @@
 import os
+import re
+import functools
+import textwrap
 from dotenv import load_dotenv
 import json
 from typing import List, Dict, Optional, Union
-from merchant_feedback import MerchantFeedbackSystem
 from handlers.logger import logger
 from chroma_setup import ChromaDBManager
 from model_clients.clients import create_model_client
@@ -15,6 +17,7 @@ import base64
 from io import BytesIO
 import traceback
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 from handlers.config_reader import ConfigReader
 
@@ -27,12 +30,29 @@ conf = config.read_config()
 MODEL_NAME = conf.get("model.model_name")
 EMBEDDING_MODEL = conf.get("model.embedding_model")
 DEFAULT_CHROMA_DIR = conf.get("sys_config.base_chromadb_dir")
-DEFAULT_N_RESULTS = conf.get("sys_config.default_n_results")
+DEFAULT_N_RESULTS = int(conf.get("sys_config.default_n_results") or 5)
+
+
+@functools.lru_cache(maxsize=4)
+def _client(model_name: str):
+    """Return a shared client per model so its HTTP connection pool is reused across calls"""
+    return create_model_client(model_name)
+
 
 # Initialize components
 chroma_manager = ChromaDBManager(persist_directory=DEFAULT_CHROMA_DIR)
-main_client = create_model_client(MODEL_NAME)
+main_client = _client(MODEL_NAME)
 ux_manager = UXPrinciplesManager()
+# Runs the independent post-processing LLM calls (scoring, summary) side by side
+executor = ThreadPoolExecutor(max_workers=8)
+
+
+@functools.lru_cache(maxsize=len(FlowType))
+def _ux_principles_for(flow_type: FlowType) -> str:
+    """Format the UX principles prompt block for a flow type; identical for every test of that flow"""
+    principles = ux_manager.get_principles_for_flow(flow_type)
+    return "\n".join(f"- {p.name}: {p.description}" for p in principles)
+
 
 # Persona Definitions
 personas = {
@@ -68,6 +88,10 @@ personas = {
     }
 }
 
+# Normalise the indented characteristics once so every prompt sends the trimmed text
+for _persona in personas.values():
+    _persona["characteristics"] = textwrap.dedent(_persona["characteristics"]).strip()
+
 
 # Feature Testing Query Template
 test_query_template = """
@@ -121,6 +145,35 @@ Provide specific, actionable feedback that reflects:
 Format your response as if you were speaking directly about your experience with the feature.
 """
 
+def _to_rgb(img: Image.Image) -> Image.Image:
+    """Convert to RGB for JPEG, flattening any transparency onto white rather than dropping it to black"""
+    if not img.has_transparency_data:
+        return img.convert("RGB")
+    rgba = img.convert("RGBA")
+    background = Image.new("RGB", rgba.size, (255, 255, 255))
+    background.paste(rgba, mask=rgba.getchannel("A"))
+    return background
+
+def _resize_and_b64(image_path: str) -> Dict:
+    """Downscale the image to fit 512x512 and return it as base64 JPEG with its details"""
+    with Image.open(image_path) as img:
+        format = img.format
+        mode = img.mode
+        img.draft("RGB", (512, 512))  # Let JPEG decoding skip straight to a reduced scale
+        img.thumbnail((512, 512))  # Resize in place to reduce size, keeping aspect ratio
+        width, height = img.size
+
+        buffered = BytesIO()
+        _to_rgb(img).save(buffered, format="JPEG", quality=85)  # Compress image
+
+    return {
+        "base64": base64.b64encode(buffered.getvalue()).decode('utf-8'),
+        "width": width,
+        "height": height,
+        "mode": mode,
+        "format": format
+    }
+
 def analyze_image(image_path: str, model_name: str = MODEL_NAME) -> str:
     """
     Analyze image using LLM and return structured description
@@ -133,20 +186,11 @@ def analyze_image(image_path: str, model_name: str = MODEL_NAME) -> str:
         String containing the analysis
     """
     try:
-        # Get basic image information
-        img = img.resize((512, 512))  # Resize to reduce size
-        width, height = img.size
-        mode = img.mode
-        format = img.format
-        
-        # Convert image to base64 for LLM analysis
-        buffered = BytesIO()
-        img.save(buffered, format="PNG", quality=85)  # Compress image
-        buffered.seek(0)  # Important: seek back to the beginning
-        base64_image = base64.b64encode(buffered.getvalue()).decode('utf-8')
+        # Get basic image information and convert it to base64 for LLM analysis
+        image = _resize_and_b64(image_path)
         
         # Use LLM to analyze the image
-        client = create_model_client(model_name)
+        client = _client(model_name)
         analysis_prompt = f"""
             Analyze this design interface image and provide a detailed description focusing on:
             1. UI Components and Layout
@@ -156,20 +200,21 @@ def analyze_image(image_path: str, model_name: str = MODEL_NAME) -> str:
             5. Potential Usability Concerns
             
             Image Details:
-            - Dimensions: {width}x{height} pixels
-            - Format: {format}
-            - Color Mode: {mode}
+            - Dimensions: {image["width"]}x{image["height"]} pixels
+            - Format: {image["format"]}
+            - Color Mode: {image["mode"]}
         """
         
         # Get analysis from LLM with image in the proper format
-        analysis = client.send_request(analysis_prompt, base64_image)
+        analysis = client.send_request(analysis_prompt, image["base64"])
         return analysis
     except Exception as e:
         logger.error(f"Error analyzing image: {str(e)}")
         return ""
         
 
-def generate_context_keywords(text: str, image_path: Optional[str] = None, model_name: str = MODEL_NAME) -> str:
+def generate_context_keywords(text: str, image_path: Optional[str] = None, model_name: str = MODEL_NAME,
+                              image_analysis: Optional[str] = None) -> str:
     """
     Generate keywords and summary from text and image context
 
@@ -177,17 +222,19 @@ def generate_context_keywords(text: str, image_path: Optional[str] = None, model
         text: Text description of the feature to test
         image_path: Path to image file for visual feedback
         model_name: Name of the model to use
+        image_analysis: Precomputed analysis of the image, skips re-analyzing image_path
 
     Returns:
         String containing the keywords and summary
     """
     try:
-        client = create_model_client(model_name)
+        client = _client(model_name)
         
         # Prepare image context if provided
         image_context = ""
-        if image_path and os.path.exists(image_path):
+        if image_analysis is None and image_path and os.path.exists(image_path):
             image_analysis = analyze_image(image_path, model_name)
+        if image_analysis:
             image_context = f"\nVisual Design Analysis:\n{image_analysis}"
         
         context_prompt = f"""
@@ -225,7 +272,7 @@ def calculate_usability_score(response: str, model_name: str = MODEL_NAME) -> fl
         Float score between 1.0 and 5.0
     """
     try:
-        client = create_model_client(model_name)
+        client = _client(model_name)
 
         scoring_prompt = f"""
         Evaluate the following user test response against these core design principles:
@@ -273,6 +320,48 @@ def calculate_usability_score(response: str, model_name: str = MODEL_NAME) -> fl
         logger.error(f"Error calculating usability score: {str(e)}")
         return 3.0  # Default score on error
 
+_SECTION_NAMES = ("Value Offering", "Feature Usefulness", "Ease of Use", "Discoverability", "Design Appeal")
+# Numbered section heading, e.g. "1. Value Offering", "### 2. **Ease of Use**:" or "**3. Discoverability:**",
+# followed by the optional ":"/"-" separator before an answer given on the same line
+_SECTION_HEADER = r"[ \t#>*_]*\d\.\s*[*_]*\s*{name}\b[ \t*_]*[:\-\u2013\u2014]?[ \t*_]*"
+_SECTION_NAME = "|".join(_SECTION_NAMES)
+_SECTION_RE = re.compile(
+    r"(?:^|\n)" + _SECTION_HEADER.format(name=f"({_SECTION_NAME})") + r"([^\n]*)"
+    r"(.*?)(?=\n" + _SECTION_HEADER.format(name=f"(?:{_SECTION_NAME})") + r"|\Z)",
+    re.DOTALL | re.IGNORECASE
+)
+_QUOTE_RE = re.compile(r'["\u201c]([^"\u201d\n]{10,})["\u201d]')
+_BULLET_RE = re.compile(r"^[\s\-*\u2022>]+")
+
+def parse_feedback_sections(feedback: str) -> Optional[Dict]:
+    """
+    Build the feedback summary directly from the numbered template sections
+
+    Args:
+        feedback: Feedback from the merchant
+
+    Returns:
+        Dictionary containing the structured summary, or None if any section is missing
+    """
+    sections = {}
+    for match in _SECTION_RE.finditer(feedback):
+        name = next(n for n in _SECTION_NAMES if n.lower() == match.group(1).lower())
+        # An answer on the heading line itself comes first
+        text = match.group(2) + "\n" + match.group(3)
+        lines = [_BULLET_RE.sub("", line).strip() for line in text.splitlines()]
+        lines = [line for line in lines if line]
+        if name in sections or not lines:
+            continue
+        quotes = _QUOTE_RE.findall(text)
+        sections[name] = {
+            "summary": " ".join(lines[:3]),
+            "quote": max(quotes, key=len) if quotes else lines[0]
+        }
+
+    if len(sections) != len(_SECTION_NAMES):
+        return None
+    return {name: sections[name] for name in _SECTION_NAMES}
+
 def format_feedback_summary(feedback: str, model_name: str = MODEL_NAME) -> Dict:
     """
     Format the feedback into a structured summary using the specified model.
@@ -284,8 +373,14 @@ def format_feedback_summary(feedback: str, model_name: str = MODEL_NAME) -> Dict
     Returns:
         Dictionary containing the structured summary
     """
+    # Feedback that follows the template's numbered sections needs no LLM round-trip
+    parsed = parse_feedback_sections(feedback)
+    if parsed is not None:
+        logger.info("Feedback summary parsed from template sections")
+        return parsed
+
     try:
-        client = create_model_client(model_name)
+        client = _client(model_name)
         summary_prompt = f"""
         Analyze the following merchant feedback and extract key points for each category:
         {feedback}
@@ -400,7 +495,8 @@ def run_feature_test(
     flow_type: Optional[FlowType] = None,
     image_path: Optional[str] = None,
     persona_names: List[str] = None,
-    model_name: str = MODEL_NAME
+    model_name: str = MODEL_NAME,
+    n_results: int = DEFAULT_N_RESULTS
 ) -> Dict:
     """
     Run feature test with optional image analysis
@@ -411,19 +507,21 @@ def run_feature_test(
         image_path: Path to image file for visual feedback
         persona_names: List of personas to test with
         model_name: Name of the model to use
+        n_results: Number of results to retrieve from ChromaDB
 
     Returns:
         Dictionary containing results
     """
     try:
-        client = create_model_client(model_name)
+        client = _client(model_name)
         
-        # Step 1: Generate context from text and image
-        context_query = generate_context_keywords(feature_text, image_path, model_name)
+        # Step 1: Generate context from text and image, analyzing the image only once per test
+        image_analysis = analyze_image(image_path, model_name) if image_path else ""
+        context_query = generate_context_keywords(feature_text, image_path, model_name, image_analysis=image_analysis)
         logger.info(f"Context query: {context_query}")
         
-        # Step 2: Retrieve context from ChromaDB
-        chroma_results = chroma_manager.query(context_query)
+        # Step 2: Retrieve context from ChromaDB, reranked for diversity
+        chroma_results = chroma_manager.query_mmr(context_query, n_results=n_results)
         logger.info(f"ChromaDB RAG results: {json.dumps(chroma_results, indent=2)}")
         retrieved_docs_texts = []
         if chroma_results and chroma_results.get('documents') and \
@@ -440,12 +538,10 @@ def run_feature_test(
             logger.info("ChromaDB RAG: Context is empty after retrieval and processing.")
 
         # Step 3: Get UX principles if flow type is provided
-        ux_principles = ""
-        if flow_type:
-            principles = ux_manager.get_principles_for_flow(flow_type)
-            ux_principles = "\n".join([f"- {p.name}: {p.description}" for p in principles])
+        ux_principles = _ux_principles_for(flow_type) if flow_type else ""
         
         results = []
+        pending_docs, pending_ids, pending_metas = [], [], []
         for persona_name in (persona_names or ["internet_first_entrepreneur"]):
             if persona_name not in personas:
                 logger.warning(f"Persona {persona_name} not found, skipping")
@@ -459,7 +555,7 @@ def run_feature_test(
                 persona_description=persona["description"],
                 persona_characteristics=persona["characteristics"],
                 feature_description=feature_text,
-                image_context=f"\nVisual Analysis:\n{analyze_image(image_path) if image_path else ''}",
+                image_context=f"\nVisual Analysis:\n{image_analysis}",
                 context=context,
                 ux_principles=ux_principles
             )
@@ -470,12 +566,14 @@ def run_feature_test(
             feedback = client.send_request(query)
             logger.info(f"Feedback: {feedback}")
             
-            # Calculate usability score
-            score = calculate_usability_score(feedback, model_name)
+            # Calculate usability score and format feedback summary in parallel
+            score_future = executor.submit(calculate_usability_score, feedback, model_name)
+            summary_future = executor.submit(format_feedback_summary, feedback, model_name)
+
+            score = score_future.result()
             logger.info(f"Usability Score: {score}")
             
-            # Format feedback summary
-            summary = format_feedback_summary(feedback, model_name)
+            summary = summary_future.result()
             logger.info(f"Formated Feedback Summary: {summary}")
             
             results.append({
@@ -490,23 +588,29 @@ def run_feature_test(
 
             logger.info(f"Final Results: {results}")
 
-            # Store the results in ChromaDB
+            # Queue the results for a single batched ChromaDB insert
             feedback_id = str(uuid.uuid4())
+            pending_docs.append(feedback)
+            pending_ids.append(feedback_id)
+            pending_metas.append({
+                "persona": persona_name,
+                "feature": feature_text,
+                "score": score,
+                "type": "feedback",
+                "original_id": feedback_id
+            })
+
+        # Store the results in ChromaDB
+        if pending_docs:
             chroma_manager.add_documents(
-                documents=[feedback],
-                ids=[feedback_id],
-                metadatas=[{
-                    "persona": persona_name,
-                    "feature": feature_text,
-                    "score": score,
-                    "type": "feedback",
-                    "original_id": feedback_id
-                }]
+                documents=pending_docs,
+                ids=pending_ids,
+                metadatas=pending_metas
             )
             
         return {
             "feature_name": feature_text.split(":")[0] if ":" in feature_text else feature_text,
-            "flow_type": flow_type.value if flow_type else "general",
+            "flow_type": flow_type.label if flow_type else "general",
             "test_results": results
         }
         
@@ -514,7 +618,7 @@ def run_feature_test(
         logger.error(f"Error running feature test: {str(e)}\\n{traceback.format_exc()}")
         return {
             "feature_name": feature_text.split(":")[0] if ":" in feature_text else feature_text,
-            "flow_type": flow_type.value if flow_type else "general",
+            "flow_type": flow_type.label if flow_type else "general",
             "test_results": []
         }
 
@@ -533,57 +637,40 @@ def test_merchant_feedback(feature_text: str, image_path: Optional[str] = None,
         n_results: Number of results to retrieve from ChromaDB
     """
     try:
-        # Initialize the feedback system
-        feedback_system = MerchantFeedbackSystem()
-        
         # Run feature tests
         logger.info("Starting feature tests...")
         feedback_results = run_feature_test(
-            feature_text,
-            image_path,
-            selected_personas,
-            flow_type,
+            feature_text=feature_text,
+            flow_type=flow_type,
+            image_path=image_path,
+            persona_names=selected_personas,
             n_results=n_results
         )
         
         print(f"\nFeature Feedback Results:")
-        for persona, result in feedback_results.items():
-            print(f"\n{persona} Feedback:")
+        for result in feedback_results["test_results"]:
+            print(f"\n{result['persona']} Feedback:")
             print(f"Usability Score: {result['usability_score']['score']:.1f} ({result['usability_score']['rating']})")
             print(f"Feedback: {result['raw_feedback']}")
-            print(f"Context Used: {result['context_used'][:200]}...")
+
+        return feedback_results
                 
     except Exception as e:
         logger.error(f"Error in test_merchant_feedback: {str(e)}")
         raise
 
+_FLOW_RE = re.compile("|".join(re.escape(f.label) for f in FlowType), re.IGNORECASE)
+
 def extract_flow_type_from_text(text: str) -> Optional[FlowType]:
     """Extract flow type from feature text if not explicitly provided"""
-    text_lower = text.lower()
-    flow_type_mapping = {
-        "checkout": FlowType.CHECKOUT,
-        "payment": FlowType.PAYMENT,
-        "onboarding": FlowType.ONBOARDING,
-        "dashboard": FlowType.DASHBOARD,
-        "analytics": FlowType.ANALYTICS,
-        "general": FlowType.GENERAL,
-        "ethical": FlowType.ETHICAL,
-        "visual": FlowType.VISUAL,
-        "pricing": FlowType.PRICING,
-        "content": FlowType.CONTENT,
-        "gamification": FlowType.GAMIFICATION,
-        "cart": FlowType.CART
-    }
-    
-    for flow_name, flow_type in flow_type_mapping.items():
-        if flow_name in text_lower:
-            return flow_type
-    return None
+    # A single pass over the text; the earliest flow keyword mentioned wins
+    match = _FLOW_RE.search(text)
+    return FlowType.from_label(match.group(0).lower()) if match else None
 
 def main():
     parser = argparse.ArgumentParser(description="Run merchant feedback tests")
     parser.add_argument("--feature_text", required=True, help="Feature description in format 'Feature name: Description'")
-    parser.add_argument("--flow_type", choices=[f.value for f in FlowType], help="Type of user flow")
+    parser.add_argument("--flow_type", choices=[f.label for f in FlowType], help="Type of user flow")
     parser.add_argument("--image", help="Path to image file for visual analysis")
     parser.add_argument("--personas", nargs="+", 
                        choices=["internet_first_entrepreneur",  # Combined Eagle + Fox
@@ -600,11 +687,11 @@ def main():
     # Get flow type - first try explicit argument, then extract from text
     flow_type = None
     if args.flow_type:
-        flow_type = FlowType(args.flow_type)
+        flow_type = FlowType.from_label(args.flow_type)
     else:
         flow_type = extract_flow_type_from_text(feature_description)
         if flow_type:
-            logger.info(f"Extracted flow type '{flow_type.value}' from feature text")
+            logger.info(f"Extracted flow type '{flow_type.label}' from feature text")
     
     # Run test with default personas if none specified
     if not args.personas:
@@ -0,0 +1,66 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+class FakeChromaDBManager:
+    """Stands in for ChromaDBManager, recording writes and returning canned query results"""
+
+    def __init__(self, *args, **kwargs):
+        self.added = []
+
+    def query_mmr(self, query_text, n_results=5, **kwargs):
+        return {"ids": [["doc-1"]], "documents": [["Merchants want fast payouts"]], "metadatas": [[{}]], "distances": [[0.1]]}
+
+    def add_documents(self, documents, metadatas=None, ids=None, embeddings=None):
+        self.added.append({"documents": documents, "metadatas": metadatas, "ids": ids})
+
+
+class FakeModelClient:
+    """Stands in for a model client, returning fixed responses"""
+
+    feedback = (
+        "1. **Value Offering**: This would save me hours every week.\n"
+        "2. **Feature Usefulness**: Useful for daily payouts.\n"
+        "3. **Ease of Use**: Simple enough to set up.\n"
+        "4. **Discoverability**: Hard to find in the menu.\n"
+        "5. **Design Appeal**: Clean and modern.\n"
+    )
+
+    def __init__(self, model_name=None):
+        self.model_name = model_name
+
+    def send_request(self, prompt, image_base64=None):
+        if "Only return the numerical score" in prompt:
+            return "4.2"
+        if "keywords" in prompt.lower():
+            return "payouts, settlement"
+        return self.feedback
+
+    def get_token_usage(self):
+        return 0
+
+
+@pytest.fixture(scope="session")
+def feedback_module():
+    """test_merchant_feedback imported with Chroma and the model clients replaced by fakes"""
+    for dependency in ("chromadb", "openai", "boto3", "google.generativeai", "PIL", "sentence_transformers", "dotenv", "tomli"):
+        pytest.importorskip(dependency)
+
+    with pytest.MonkeyPatch.context() as mp:
+        import chroma_setup
+        from model_clients import clients
+
+        mp.chdir(ROOT)  # ConfigReader reads config/ from the working directory
+        mp.setattr(chroma_setup, "ChromaDBManager", FakeChromaDBManager)
+        mp.setattr(clients, "create_model_client", FakeModelClient)
+        sys.modules.pop("test_merchant_feedback", None)
+        module = importlib.import_module("test_merchant_feedback")
+        yield module
+        module.executor.shutdown(wait=False)
+        sys.modules.pop("test_merchant_feedback", None)
@@ -0,0 +1,79 @@
+import pytest
+
+chroma_setup = pytest.importorskip("chroma_setup", exc_type=ImportError)
+
+
+QUERY = [1.0, 0.0, 0.0]
+EMBEDDINGS = [
+    [1.0, 0.0, 0.0],
+    [0.98, 0.2, 0.0],  # Near-duplicate of the first row
+    [0.9, 0.0, 0.436],  # Less relevant but different
+]
+
+
+def test_mmr_rerank_prefers_diverse_rows():
+    assert chroma_setup.mmr_rerank(QUERY, EMBEDDINGS, k=2, lambda_mult=0.3) == [0, 2]
+
+
+def test_mmr_rerank_full_relevance_is_similarity_order():
+    assert chroma_setup.mmr_rerank(QUERY, EMBEDDINGS, k=3, lambda_mult=1.0) == [0, 1, 2]
+
+
+def test_mmr_rerank_k_larger_than_candidates():
+    assert sorted(chroma_setup.mmr_rerank(QUERY, EMBEDDINGS, k=10)) == [0, 1, 2]
+
+
+def test_mmr_rerank_no_candidates():
+    assert chroma_setup.mmr_rerank(QUERY, [], k=3) == []
+
+
+def test_query_cache_get_and_set():
+    cache = chroma_setup.QueryCache()
+    key = cache.make_key("payouts", 5)
+
+    assert cache.get(key) is None
+    cache.set(key, {"ids": [["doc-1"]]})
+    assert cache.get(key) == {"ids": [["doc-1"]]}
+    cache.clear()
+    assert cache.get(key) is None
+
+
+def test_query_cache_key_covers_query_arguments():
+    make_key = chroma_setup.QueryCache.make_key
+
+    assert make_key("payouts", 5) == make_key("payouts", 5)
+    assert make_key("payouts", 5) != make_key("payouts", 10)
+    assert make_key("payouts", 5) != make_key("payouts", 5, ["documents", "embeddings"])
+    assert make_key("payouts", 5) != make_key("settlement", 5)
+
+
+def test_query_cache_evicts_least_recently_used():
+    cache = chroma_setup.QueryCache(max_size=2)
+    cache.set("a", {"ids": "a"})
+    cache.set("b", {"ids": "b"})
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", {"ids": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"ids": "a"}
+    assert cache.get("c") == {"ids": "c"}
+
+
+def test_query_cache_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(chroma_setup.time, "monotonic", lambda: now[0])
+    cache = chroma_setup.QueryCache(ttl_seconds=60)
+    cache.set("a", {"ids": "a"})
+
+    now[0] += 59
+    assert cache.get("a") == {"ids": "a"}
+    now[0] += 2
+    assert cache.get("a") is None
+
+
+def test_query_cache_shared_per_directory():
+    cache = chroma_setup._shared_query_cache("/tmp/chroma-a")
+
+    assert chroma_setup._shared_query_cache("/tmp/chroma-a", {"max_size": 1}) is cache
+    assert cache.max_size == chroma_setup.DEFAULT_CACHE_CONFIG["max_size"]
+    assert chroma_setup._shared_query_cache("/tmp/chroma-b") is not cache
@@ -0,0 +1,67 @@
+import pytest
+
+
+INLINE_FEEDBACK = """1. **Value Offering**: This would save me hours.
+I would use it every week.
+2. **Feature Usefulness**: Useful for daily payouts.
+3. **Ease of Use** - Simple enough to set up.
+4. **Discoverability:** Hard to find in the menu.
+5. Design Appeal: Clean, "looks like a modern banking app" overall.
+"""
+
+MARKDOWN_FEEDBACK = """### 1. Value Offering
+- Saves time on reconciliation
+### 2. Feature Usefulness
+- Covers my daily payouts
+### 3. Ease of Use
+- Easy to follow
+### 4. Discoverability
+- Buried under settings
+### 5. Design Appeal
+- Looks trustworthy
+"""
+
+
+def test_inline_answers_are_kept(feedback_module):
+    sections = feedback_module.parse_feedback_sections(INLINE_FEEDBACK)
+
+    assert list(sections) == list(feedback_module._SECTION_NAMES)
+    assert sections["Value Offering"]["summary"] == "This would save me hours. I would use it every week."
+    assert sections["Ease of Use"]["summary"] == "Simple enough to set up."
+    assert sections["Discoverability"]["summary"] == "Hard to find in the menu."
+    assert sections["Design Appeal"]["quote"] == "looks like a modern banking app"
+
+
+def test_markdown_headers(feedback_module):
+    sections = feedback_module.parse_feedback_sections(MARKDOWN_FEEDBACK)
+
+    assert sections["Value Offering"] == {
+        "summary": "Saves time on reconciliation",
+        "quote": "Saves time on reconciliation"
+    }
+    assert sections["Design Appeal"]["summary"] == "Looks trustworthy"
+
+
+def test_missing_section_returns_none(feedback_module):
+    feedback = MARKDOWN_FEEDBACK.replace("### 4. Discoverability\n- Buried under settings\n", "")
+
+    assert feedback_module.parse_feedback_sections(feedback) is None
+
+
+def test_empty_section_returns_none(feedback_module):
+    feedback = INLINE_FEEDBACK.replace("Useful for daily payouts.", "")
+
+    assert feedback_module.parse_feedback_sections(feedback) is None
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Instant payouts shown on the Dashboard", "dashboard"),
+    ("One-tap checkout that remembers the cart", "checkout"),  # The earliest mention wins
+    ("Faster CART recovery emails", "cart"),
+])
+def test_extract_flow_type_from_text(feedback_module, text, expected):
+    assert feedback_module.extract_flow_type_from_text(text) is feedback_module.FlowType.from_label(expected)
+
+
+def test_extract_flow_type_from_text_without_keyword(feedback_module):
+    assert feedback_module.extract_flow_type_from_text("Bulk refunds for marketplaces") is None
@@ -0,0 +1,33 @@
+import inspect
+
+
+def test_run_feature_test_signature(feedback_module):
+    parameters = inspect.signature(feedback_module.run_feature_test).parameters
+
+    assert list(parameters) == ["feature_text", "flow_type", "image_path", "persona_names", "model_name", "n_results"]
+    assert parameters["flow_type"].default is None
+    assert parameters["n_results"].default == feedback_module.DEFAULT_N_RESULTS
+
+
+def test_run_feature_test_smoke(feedback_module):
+    feedback_module.run_feature_test.cache_clear()
+    added_before = len(feedback_module.chroma_manager.added)
+
+    result = feedback_module.run_feature_test(
+        "Instant payouts: Settle card payments to the bank account within minutes",
+        flow_type=feedback_module.FlowType.PAYMENT,
+        persona_names=("internet_first_entrepreneur",)
+    )
+
+    assert result["feature_name"] == "Instant payouts"
+    assert result["flow_type"] == "payment"
+    [test_result] = result["test_results"]
+    assert test_result["persona"] == "internet_first_entrepreneur"
+    assert test_result["usability_score"]["score"] == 4.2
+    assert list(test_result["feedback_summary"]) == list(feedback_module._SECTION_NAMES)
+    assert test_result["feedback_summary"]["Value Offering"]["summary"] == "This would save me hours every week."
+
+    [write] = feedback_module.chroma_manager.added[added_before:]
+    assert write["documents"] == [test_result["raw_feedback"]]
+    assert write["metadatas"][0]["type"] == "feedback"
+    assert write["metadatas"][0]["score"] == 4.2
@@ -0,0 +1,110 @@
+import pytest
+
+from ux_principles import (
+    FlowType,
+    UXPrinciplesManager,
+    _PRINCIPLES_DATA,
+    catalog_by_category,
+    catalog_by_min_priority,
+    own_highest_priority,
+    own_principles,
+    own_top_k,
+    own_top_priority,
+)
+
+
+def test_from_label_round_trips():
+    for flow_type in FlowType:
+        assert FlowType.from_label(flow_type.label) is flow_type
+
+
+def test_from_label_rejects_unknown_labels():
+    with pytest.raises(ValueError):
+        FlowType.from_label("refunds")
+    with pytest.raises(ValueError):
+        FlowType.from_label("PAYMENT")
+
+
+def test_catalog_covers_every_flow():
+    assert set(_PRINCIPLES_DATA) == set(FlowType)
+    assert all(_PRINCIPLES_DATA[flow_type] for flow_type in FlowType)
+
+
+def test_catalog_is_keyed_by_flow_type_only():
+    with pytest.raises(KeyError):
+        _PRINCIPLES_DATA["payment"]
+    with pytest.raises(KeyError):
+        _PRINCIPLES_DATA[int(FlowType.PAYMENT)]
+
+
+def test_own_principles_are_sorted_by_priority():
+    for flow_type in FlowType:
+        priorities = [p.priority for p in own_principles(flow_type)]
+        assert priorities == sorted(priorities, reverse=True)
+
+
+def test_own_lookups():
+    principles = own_principles(FlowType.CHECKOUT)
+
+    assert own_top_k(FlowType.CHECKOUT, 3) == principles[:3]
+    assert own_top_priority(FlowType.CHECKOUT) == tuple(p for p in principles if p.priority >= 4)
+    assert own_top_priority(FlowType.CHECKOUT, 5) == tuple(p for p in principles if p.priority >= 5)
+    assert own_highest_priority(FlowType.CHECKOUT) == principles[0].priority
+
+
+def test_lookups_accept_flow_labels():
+    manager = UXPrinciplesManager()
+
+    assert own_principles("cart") == own_principles(FlowType.CART)
+    assert own_top_k("cart", 2) == own_top_k(FlowType.CART, 2)
+    assert own_top_priority("cart") == own_top_priority(FlowType.CART)
+    assert own_highest_priority("cart") == own_highest_priority(FlowType.CART)
+    assert manager.get_principles_for_flow("cart") == manager.get_principles_for_flow(FlowType.CART)
+    assert manager.get_high_priority_principles("cart") == manager.get_high_priority_principles(FlowType.CART)
+    assert manager.generate_prompt_context("cart") == manager.generate_prompt_context(FlowType.CART)
+    with pytest.raises(ValueError):
+        own_top_k("refunds", 2)
+
+
+def test_catalog_lookups():
+    category = own_principles(FlowType.CHECKOUT)[0].category
+
+    assert catalog_by_category(category)
+    assert all(p.category == category for p in catalog_by_category(category))
+    assert catalog_by_category("No Such Category") == ()
+    assert all(p.priority >= 5 for p in catalog_by_min_priority(5))
+
+
+def test_manager_is_shared():
+    assert UXPrinciplesManager() is UXPrinciplesManager()
+
+
+def test_manager_merges_cross_cutting_flows():
+    manager = UXPrinciplesManager()
+    principles = manager.get_principles_for_flow(FlowType.PAYMENT)
+    own = own_principles(FlowType.PAYMENT)
+
+    assert principles[:len(own)] == own
+    assert set(own_principles(FlowType.GENERAL)) <= set(principles)
+
+
+def test_manager_high_priority_and_category():
+    manager = UXPrinciplesManager()
+    principles = manager.get_principles_for_flow(FlowType.PAYMENT)
+
+    assert manager.get_high_priority_principles(FlowType.PAYMENT) == tuple(p for p in principles if p.priority >= 4)
+    category = principles[0].category
+    assert manager.get_principles_by_category(FlowType.PAYMENT, category) == tuple(
+        p for p in principles if p.category == category
+    )
+    assert manager.get_principles_by_category(FlowType.PAYMENT, "No Such Category") == ()
+
+
+def test_generate_prompt_context():
+    manager = UXPrinciplesManager()
+    context = manager.generate_prompt_context(FlowType.PAYMENT)
+
+    assert context.startswith("UX Principles for payment flow:\n\n")
+    for p in manager.get_high_priority_principles(FlowType.PAYMENT):
+        assert f"- {p.name}: {p.description} (Priority: {p.priority})\n" in context
+    assert manager.generate_prompt_context(FlowType.PAYMENT) is context
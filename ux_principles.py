@@ -1,1118 +1,391 @@
-from typing import Dict, List
-from dataclasses import dataclass
-from enum import Enum
-
-class FlowType(Enum):
-    CHECKOUT = "checkout"
-    PAYMENT = "payment"
-    ONBOARDING = "onboarding"
-    DASHBOARD = "dashboard"
-    ANALYTICS = "analytics"
-    GENERAL = "general"  # Added for universal UX principles
-    ETHICAL = "ethical"  # New category for ethical design principles
-    VISUAL = "visual"  # New category for visual design principles
-    PRICING = "pricing"  # New category for pricing transparency
-    CONTENT = "content"  # New category for UX writing principles
-    GAMIFICATION = "gamification"  # New category for gamification principles
-    CART = "cart"  # New category for cart and checkout optimization
-
-@dataclass
-class UXPrinciple:
+import functools
+import itertools
+import json
+import operator
+import sys
+from array import array
+from collections import defaultdict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, TypeVar, Union
+from enum import IntEnum
+
+
+class FlowType(IntEnum):
+    CHECKOUT = 1
+    PAYMENT = 2
+    ONBOARDING = 3
+    DASHBOARD = 4
+    ANALYTICS = 5
+    GENERAL = 6  # Added for universal UX principles
+    ETHICAL = 7  # New category for ethical design principles
+    VISUAL = 8  # New category for visual design principles
+    PRICING = 9  # New category for pricing transparency
+    CONTENT = 10  # New category for UX writing principles
+    GAMIFICATION = 11  # New category for gamification principles
+    CART = 12  # New category for cart and checkout optimization
+
+    @property
+    def label(self) -> str:
+        """String name used in the UI, CLI and serialized results."""
+        return _FLOW_LABELS[self]
+
+    @classmethod
+    def from_label(cls, label: str) -> "FlowType":
+        """Resolve a flow type from its string label."""
+        try:
+            return _FLOW_BY_LABEL[label]
+        except KeyError:
+            raise ValueError(f"{label!r} is not a valid {cls.__name__}") from None
+
+
+_FLOW_LABELS: Dict[FlowType, str] = {flow_type: flow_type.name.lower() for flow_type in FlowType}
+_FLOW_BY_LABEL: Dict[str, FlowType] = {label: flow_type for flow_type, label in _FLOW_LABELS.items()}
+
+
+class UXPrinciple(NamedTuple):
     name: str
     description: str
     source: str
     category: str
     priority: int = 1  # 1-5, 5 being highest priority
 
+
+# Shared default for lookups that find no principles
+_EMPTY: Tuple[UXPrinciple, ...] = ()
+
+
+# Canonical instance of every record built so far, so a principle listed under
+# several flows is one shared object
+_REGISTRY: Dict[UXPrinciple, UXPrinciple] = {}
+
+
+def _p(name: str, description: str, source: str, category: str, priority: int = 1) -> UXPrinciple:
+    """Construct a catalog record, interning its repeated strings and the record itself."""
+    record = UXPrinciple(
+        name=sys.intern(name),
+        description=description,
+        source=sys.intern(source),
+        category=sys.intern(category),
+        priority=priority
+    )
+    return _REGISTRY.setdefault(record, record)
+
+
+# The catalog is maintained as data in ux_principles.json; each flow is built from it
+# on first access.
+_SOURCE_PATH = Path(__file__).with_name("ux_principles.json")
+
+# Catalog section holding records listed under several flows; a flow lists one
+# as {"ref": key} so every flow shares the same canonical record
+_SHARED_KEY = "_shared"
+
+
+@functools.cache
+def _load_source() -> Dict[str, Dict]:
+    with open(_SOURCE_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _flow_labels() -> List[str]:
+    """Flow labels present in the JSON catalog, in catalog order."""
+    return [label for label in _load_source() if label != _SHARED_KEY]
+
+
+@functools.cache
+def _build(flow_type: FlowType) -> Tuple[UXPrinciple, ...]:
+    """
+    Build one flow's principles from the JSON catalog.
+
+    Each flow's tuple is sorted highest priority first (stable, so records of
+    equal priority keep their catalog order). Callers may rely on this order.
+    """
+    source = _load_source()
+    shared = source.get(_SHARED_KEY, {}).get("principles", {})
+    records = (
+        _p(**(shared[record["ref"]] if "ref" in record else record))
+        for record in source[flow_type.label]["principles"]
+    )
+    return tuple(sorted(records, key=lambda p: -p.priority))
+
+
+class _LazyPrinciples(Mapping):
+    """Read-only FlowType -> principles mapping, each flow built from the JSON on first access"""
+
+    __slots__ = ()
+
+    def __getitem__(self, flow_type: FlowType) -> Tuple[UXPrinciple, ...]:
+        if not isinstance(flow_type, FlowType) or flow_type.label not in _flow_labels():
+            raise KeyError(flow_type)
+        return _build(flow_type)
+
+    def __iter__(self) -> Iterator[FlowType]:
+        return (FlowType.from_label(label) for label in _flow_labels())
+
+    def __len__(self) -> int:
+        return len(_flow_labels())
+
+
+_PRINCIPLES_DATA: Mapping[FlowType, Tuple[UXPrinciple, ...]] = _LazyPrinciples()
+
+
+class _PrincipleTable:
+    """
+    Flat, column-oriented copy of the catalog with precomputed bucket indexes.
+
+    Each distinct record is stored once in `records`, even when it is listed
+    under several flows. The by_flow, by_category and by_priority indexes map
+    a key to the row indices of its records, so lookups on any axis are a
+    single dict access.
+    """
+
+    __slots__ = (
+        "records", "names", "descriptions", "priorities",
+        "source_names", "source_codes", "category_names", "category_codes",
+        "by_flow", "by_category", "by_priority",
+    )
+
+    def __init__(self, principles: Mapping[FlowType, Tuple[UXPrinciple, ...]]):
+        records: List[UXPrinciple] = []
+        self.priorities = array('B')
+
+        row_of: Dict[UXPrinciple, int] = {}
+        by_flow: Dict[FlowType, List[int]] = {}
+        by_category: Dict[str, List[int]] = {}
+        by_priority: Dict[int, List[int]] = {}
+        for flow_type, flow_records in principles.items():
+            rows = by_flow.setdefault(flow_type, [])
+            for record in flow_records:
+                i = row_of.get(record)
+                if i is None:
+                    i = row_of[record] = len(records)
+                    records.append(record)
+                    self.priorities.append(record.priority)
+                    by_category.setdefault(record.category, []).append(i)
+                    by_priority.setdefault(record.priority, []).append(i)
+                rows.append(i)
+
+        # Columns are frozen into tuples once built: no growth slack, and safe to share
+        self.records: Tuple[UXPrinciple, ...] = tuple(records)
+        self.names: Tuple[str, ...] = tuple(r.name for r in records)
+        self.descriptions: Tuple[str, ...] = tuple(r.description for r in records)
+
+        # Sources and categories take a few dozen distinct values, so each row stores
+        # a one-byte code into the sorted tuple of distinct values
+        self.source_names: Tuple[str, ...] = tuple(sorted({r.source for r in records}))
+        self.category_names: Tuple[str, ...] = tuple(sorted({r.category for r in records}))
+        source_code = {source: code for code, source in enumerate(self.source_names)}
+        category_code = {category: code for code, category in enumerate(self.category_names)}
+        self.source_codes = array('B', (source_code[r.source] for r in records))
+        self.category_codes = array('B', (category_code[r.category] for r in records))
+
+        self.by_flow: Dict[FlowType, Tuple[int, ...]] = {k: tuple(v) for k, v in by_flow.items()}
+        self.by_category: Dict[str, Tuple[int, ...]] = {k: tuple(v) for k, v in by_category.items()}
+        self.by_priority: Dict[int, Tuple[int, ...]] = {k: tuple(v) for k, v in by_priority.items()}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def row(self, i: int) -> UXPrinciple:
+        """Record stored at row i."""
+        return self.records[i]
+
+    def source(self, i: int) -> str:
+        """Source of the record at row i, decoded from its code."""
+        return self.source_names[self.source_codes[i]]
+
+    def category(self, i: int) -> str:
+        """Category of the record at row i, decoded from its code."""
+        return self.category_names[self.category_codes[i]]
+
+    def rows(self, indices: Iterable[int]) -> Tuple[UXPrinciple, ...]:
+        return tuple(self.records[i] for i in indices)
+
+    def by_min_priority(self, min_priority: int) -> Tuple[int, ...]:
+        """Row indices of records with priority >= min_priority, joined from the priority buckets."""
+        return tuple(sorted(
+            i for priority, rows in self.by_priority.items() if priority >= min_priority for i in rows
+        ))
+
+    def highest_priority(self, flow_type: FlowType) -> int:
+        """Highest priority among a flow's records (0 if none)."""
+        rows = self.by_flow.get(flow_type, ())
+        # Flow rows follow the flow's priority-sorted order, so the first is the highest
+        return self.priorities[rows[0]] if rows else 0
+
+
+@functools.cache
+def _principle_table() -> _PrincipleTable:
+    return _PrincipleTable(_PRINCIPLES_DATA)
+
+
+@functools.cache
+def principles_frame():
+    """
+    The catalog as a pandas DataFrame, one row per (flow, principle) listing.
+
+    Columns are flow (label), name, description, source, category and
+    priority (uint8), for bulk filtering and grouping, e.g.
+    principles_frame().query("flow == 'checkout' and priority >= 4").
+    UXPrinciple remains the row type returned by the manager.
+    """
+    import pandas as pd  # Only needed for bulk analysis, kept off the import path
+
+    table = _principle_table()
+    flows = [flow_type.label for flow_type, rows in table.by_flow.items() for _ in rows]
+    rows = [i for flow_rows in table.by_flow.values() for i in flow_rows]
+    return pd.DataFrame({
+        "flow": pd.Categorical(flows),
+        "name": [table.names[i] for i in rows],
+        "description": [table.descriptions[i] for i in rows],
+        "source": pd.Categorical.from_codes([table.source_codes[i] for i in rows], table.source_names),
+        "category": pd.Categorical.from_codes([table.category_codes[i] for i in rows], table.category_names),
+        "priority": pd.array([table.priorities[i] for i in rows], dtype="uint8"),
+    })
+
+
+# Lookups scoped to a flow's own principles ("own_") or to the whole catalog ("catalog_").
+# UXPrinciplesManager's methods cover a flow merged with the cross-cutting flows.
+# Every public lookup taking a flow accepts either a FlowType or its label.
+
+def _resolve(flow_type: Union[FlowType, str]) -> FlowType:
+    """The FlowType for a flow type or flow label; raises ValueError for unknown labels."""
+    return FlowType.from_label(flow_type) if isinstance(flow_type, str) else flow_type
+
+
+def own_principles(flow_type: Union[FlowType, str]) -> Tuple[UXPrinciple, ...]:
+    """Principles defined for a single flow type, highest priority first."""
+    return _PRINCIPLES_DATA[_resolve(flow_type)]
+
+
+def own_top_k(flow_type: Union[FlowType, str], k: int) -> Tuple[UXPrinciple, ...]:
+    """The k highest-priority principles defined for a flow type."""
+    return _PRINCIPLES_DATA[_resolve(flow_type)][:k]
+
+
+def own_top_priority(flow_type: Union[FlowType, str], min_priority: int = 4) -> Tuple[UXPrinciple, ...]:
+    """Principles defined for a flow with priority >= min_priority, memoized per (flow, min_priority)."""
+    return _own_top_priority(_resolve(flow_type), min_priority)
+
+
+@functools.lru_cache(maxsize=None)
+def _own_top_priority(flow_type: FlowType, min_priority: int) -> Tuple[UXPrinciple, ...]:
+    # Flow tuples are sorted by descending priority, so the match is a prefix
+    return tuple(itertools.takewhile(lambda p: p.priority >= min_priority, _PRINCIPLES_DATA[flow_type]))
+
+
+def own_highest_priority(flow_type: Union[FlowType, str]) -> int:
+    """Highest priority among the principles defined for a flow type (0 if none)."""
+    return _principle_table().highest_priority(_resolve(flow_type))
+
+
+def catalog_by_category(category: str) -> Tuple[UXPrinciple, ...]:
+    """Principles across all flows in a category."""
+    table = _principle_table()
+    return table.rows(table.by_category.get(sys.intern(category), ()))
+
+
+def catalog_by_min_priority(min_priority: int) -> Tuple[UXPrinciple, ...]:
+    """Principles across all flows with priority >= min_priority."""
+    table = _principle_table()
+    return table.rows(table.by_min_priority(min_priority))
+
+
+# Cross-cutting flows whose principles apply to every flow, in the order they are appended
+_MERGE_ORDER = (
+    FlowType.GENERAL,
+    FlowType.ETHICAL,
+    FlowType.VISUAL,
+    FlowType.PRICING,
+    FlowType.CONTENT,
+    FlowType.GAMIFICATION,
+    FlowType.CART,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _merged(flow_type: FlowType) -> Tuple[UXPrinciple, ...]:
+    """A flow's own principles followed by the cross-cutting flows' in _MERGE_ORDER."""
+    return tuple(itertools.chain(
+        _PRINCIPLES_DATA.get(flow_type, _EMPTY),
+        *(_PRINCIPLES_DATA.get(merged, _EMPTY) for merged in _MERGE_ORDER)
+    ))
+
+
+K = TypeVar("K")
+
+
+def _group(principles: Iterable[UXPrinciple], key: Callable[[UXPrinciple], K]) -> Dict[K, Tuple[UXPrinciple, ...]]:
+    """Group principles by key, keeping first-seen key order and the input order within a group."""
+    groups: Dict[K, List[UXPrinciple]] = defaultdict(list)
+    for principle in principles:
+        groups[key(principle)].append(principle)
+    return {k: tuple(grouped) for k, grouped in groups.items()}
+
+
+# Per-flow views of the merged principles, each built on first use of that flow
+
+@functools.lru_cache(maxsize=None)
+def _high_pri(flow_type: FlowType) -> Tuple[UXPrinciple, ...]:
+    return tuple(p for p in _merged(flow_type) if p.priority >= 4)
+
+
+@functools.lru_cache(maxsize=None)
+def _by_cat(flow_type: FlowType) -> Dict[str, Tuple[UXPrinciple, ...]]:
+    return _group(_merged(flow_type), operator.attrgetter("category"))
+
+
+@functools.lru_cache(maxsize=None)
+def _grouped_high_pri(flow_type: FlowType) -> Tuple[Tuple[str, Tuple[UXPrinciple, ...]], ...]:
+    """High-priority principles grouped by category, in first-seen category order."""
+    return tuple(_group(_high_pri(flow_type), operator.attrgetter("category")).items())
+
+
 class UXPrinciplesManager:
+    __slots__ = ("principles", "_prompt_cache")
+
+    # Shared process-wide instance, so the prompt cache is filled once
+    _instance: Optional["UXPrinciplesManager"] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __init__(self):
-        self.principles: Dict[FlowType, List[UXPrinciple]] = {
-            FlowType.GENERAL: [
-                # Aesthetic and Usability
-                UXPrinciple(
-                    name="Aesthetic-Usability Effect",
-                    description="Users often perceive aesthetically pleasing design as design that's more usable",
-                    source="Laws of UX",
-                    category="Perception",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Choice Overload",
-                    description="The tendency for people to get overwhelmed when presented with too many options",
-                    source="Laws of UX",
-                    category="Decision Making",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Chunking",
-                    description="Breaking down information into meaningful groups to improve comprehension",
-                    source="Laws of UX",
-                    category="Information Architecture",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Cognitive Load",
-                    description="Minimize the mental resources needed to understand and interact with an interface",
-                    source="Laws of UX",
-                    category="Performance",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Doherty Threshold",
-                    description="Maintain system response times under 400ms for optimal productivity",
-                    source="Laws of UX",
-                    category="Performance",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Fitts's Law",
-                    description="Make interactive elements large enough and close enough to be easily acquired",
-                    source="Laws of UX",
-                    category="Interaction Design",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Hick's Law",
-                    description="Reduce the number and complexity of choices to speed up decision making",
-                    source="Laws of UX",
-                    category="Decision Making",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Jakob's Law",
-                    description="Follow established design patterns that users are familiar with",
-                    source="Laws of UX",
-                    category="Consistency",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Law of Common Region",
-                    description="Group related elements within clearly defined boundaries",
-                    source="Laws of UX",
-                    category="Visual Design",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Law of Proximity",
-                    description="Place related elements close to each other",
-                    source="Laws of UX",
-                    category="Visual Design",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Law of Prägnanz",
-                    description="Use simple, clear visual forms that require minimal cognitive effort",
-                    source="Laws of UX",
-                    category="Visual Design",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Law of Similarity",
-                    description="Use consistent visual styles for related elements",
-                    source="Laws of UX",
-                    category="Visual Design",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Miller's Law",
-                    description="Limit the number of items in working memory to 7±2",
-                    source="Laws of UX",
-                    category="Information Architecture",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Occam's Razor",
-                    description="Choose the simplest solution that works",
-                    source="Laws of UX",
-                    category="Design Philosophy",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Paradox of the Active User",
-                    description="Design for immediate use without requiring extensive learning",
-                    source="Laws of UX",
-                    category="Usability",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Peak-End Rule",
-                    description="Focus on creating positive peak and ending experiences",
-                    source="Laws of UX",
-                    category="User Experience",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Postel's Law",
-                    description="Be flexible with input but strict with output",
-                    source="Laws of UX",
-                    category="Error Handling",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Serial Position Effect",
-                    description="Place important information at the beginning and end of lists",
-                    source="Laws of UX",
-                    category="Information Architecture",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Tesler's Law",
-                    description="Some complexity is inherent and cannot be eliminated",
-                    source="Laws of UX",
-                    category="Design Philosophy",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Von Restorff Effect",
-                    description="Make important elements visually distinct",
-                    source="Laws of UX",
-                    category="Visual Design",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Zeigarnik Effect",
-                    description="Show progress for incomplete tasks to improve recall",
-                    source="Laws of UX",
-                    category="Task Management",
-                    priority=4
-                )
-            ],
-            FlowType.CHECKOUT: [
-                # Core Checkout Principles
-                UXPrinciple(
-                    name="One-Click Checkout",
-                    description="Enable quick purchase completion with pre-filled information",
-                    source="Stripe",
-                    category="Efficiency",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Progress Indicators",
-                    description="Show clear progress through checkout steps with visual indicators",
-                    source="Stripe",
-                    category="Navigation",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Early Fee Disclosure",
-                    description="Display all costs (taxes, fees, shipping) at the beginning of checkout",
-                    source="Stripe",
-                    category="Transparency",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Smart Form Filling",
-                    description="Support autofill and address validation to minimize input errors",
-                    source="Stripe",
-                    category="Efficiency",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Guest Checkout",
-                    description="Allow purchase completion without account creation",
-                    source="Stripe",
-                    category="Accessibility",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Mobile Optimization",
-                    description="Ensure fully responsive and touch-friendly checkout interface",
-                    source="Stripe",
-                    category="Responsiveness",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Minimal Distractions",
-                    description="Remove unnecessary elements during checkout to maintain focus",
-                    source="Stripe",
-                    category="Focus",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Brand Consistency",
-                    description="Maintain brand identity throughout checkout for trust",
-                    source="Stripe",
-                    category="Trust",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Multiple Payment Options",
-                    description="Support various payment methods including local options",
-                    source="Stripe",
-                    category="Flexibility",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Security Indicators",
-                    description="Display trust badges and security certifications prominently",
-                    source="Stripe",
-                    category="Trust",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Error Prevention",
-                    description="Implement real-time validation and clear error messages",
-                    source="Stripe",
-                    category="Error Handling",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Address Validation",
-                    description="Verify and correct addresses in real-time",
-                    source="Stripe",
-                    category="Data Quality",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Order Summary",
-                    description="Show clear itemized breakdown of costs and items",
-                    source="Stripe",
-                    category="Transparency",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Return Policy Visibility",
-                    description="Make return policies easily accessible during checkout",
-                    source="Stripe",
-                    category="Trust",
-                    priority=3
-                ),
-                UXPrinciple(
-                    name="Save for Later",
-                    description="Allow customers to save cart for future purchase",
-                    source="Stripe",
-                    category="Flexibility",
-                    priority=3
-                )
-            ],
-            FlowType.PAYMENT: [
-                UXPrinciple(
-                    name="Multiple Payment Options",
-                    description="Offer various payment methods including UPI, cards, net banking",
-                    source="Stripe",
-                    category="Flexibility",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Secure Payment Indicators",
-                    description="Clearly display security badges and trust indicators",
-                    source="Stripe",
-                    category="Trust",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Save Payment Information",
-                    description="Allow users to save payment methods for future use",
-                    source="Stripe",
-                    category="Convenience",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Error Prevention",
-                    description="Implement validation and clear error messages",
-                    source="Don't Make Me Think",
-                    category="Error Handling",
-                    priority=4
-                )
-            ],
-            FlowType.ONBOARDING: [
-                UXPrinciple(
-                    name="Progressive Disclosure",
-                    description="Show information gradually as needed",
-                    source="Don't Make Me Think",
-                    category="Information Architecture",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Clear Value Proposition",
-                    description="Communicate benefits clearly to small businesses",
-                    source="Meesho Tech",
-                    category="Communication",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Visual Guidance",
-                    description="Use visual cues for tier 3/4 market users",
-                    source="Meesho Tech",
-                    category="Accessibility",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Localized Content",
-                    description="Use language and examples relevant to local context",
-                    source="Meesho Tech",
-                    category="Localization",
-                    priority=5
-                )
-            ],
-            FlowType.DASHBOARD: [
-                UXPrinciple(
-                    name="Information Hierarchy",
-                    description="Organize information by importance and frequency of use",
-                    source="Don't Make Me Think",
-                    category="Layout",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Action-Oriented Design",
-                    description="Make common actions easily accessible",
-                    source="GO-JEK",
-                    category="Navigation",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Real-time Updates",
-                    description="Show live data and updates",
-                    source="GO-JEK",
-                    category="Performance",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Customizable Views",
-                    description="Allow users to customize their dashboard",
-                    source="GO-JEK",
-                    category="Personalization",
-                    priority=3
-                )
-            ],
-            FlowType.ANALYTICS: [
-                UXPrinciple(
-                    name="Data Visualization",
-                    description="Use appropriate charts and graphs for data presentation",
-                    source="GO-JEK",
-                    category="Visualization",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Actionable Insights",
-                    description="Provide clear, actionable insights from data",
-                    source="GO-JEK",
-                    category="Value",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Export Options",
-                    description="Allow easy export of data in multiple formats",
-                    source="GO-JEK",
-                    category="Functionality",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Performance Metrics",
-                    description="Show key performance indicators prominently",
-                    source="GO-JEK",
-                    category="Metrics",
-                    priority=4
-                )
-            ],
-            FlowType.ETHICAL: [
-                # Anti-Deceptive Patterns
-                UXPrinciple(
-                    name="Transparent Pricing",
-                    description="Clearly display all costs, fees, and charges without hidden terms",
-                    source="D91 Labs",
-                    category="Transparency",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="No Forced Actions",
-                    description="Avoid requiring unnecessary actions or permissions to proceed",
-                    source="D91 Labs",
-                    category="User Control",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Clear Interface",
-                    description="Maintain interface clarity without misleading elements or hidden options",
-                    source="D91 Labs",
-                    category="Interface Design",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Minimal Nagging",
-                    description="Limit notifications and prompts to essential communications",
-                    source="D91 Labs",
-                    category="Communication",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Unobstructed Flow",
-                    description="Ensure users can complete tasks without artificial barriers",
-                    source="D91 Labs",
-                    category="User Flow",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="No Sneaky Practices",
-                    description="Avoid hidden costs, auto-renewals, or bundled products without clear disclosure",
-                    source="D91 Labs",
-                    category="Transparency",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Genuine Social Proof",
-                    description="Use authentic user reviews and testimonials without manipulation",
-                    source="D91 Labs",
-                    category="Trust",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="No False Urgency",
-                    description="Avoid creating artificial time pressure or scarcity",
-                    source="D91 Labs",
-                    category="User Control",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Clear Terms",
-                    description="Present terms and conditions in clear, understandable language",
-                    source="D91 Labs",
-                    category="Transparency",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Opt-In Defaults",
-                    description="Set default options to the safest choice for users",
-                    source="D91 Labs",
-                    category="User Control",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Easy Cancellation",
-                    description="Make it as easy to cancel as it is to subscribe",
-                    source="D91 Labs",
-                    category="User Control",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="No Dark Patterns",
-                    description="Avoid any design elements that manipulate user behavior",
-                    source="D91 Labs",
-                    category="Ethics",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Accessible Information",
-                    description="Ensure all important information is easily accessible and readable",
-                    source="D91 Labs",
-                    category="Transparency",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Consistent Messaging",
-                    description="Maintain consistent communication without misleading claims",
-                    source="D91 Labs",
-                    category="Communication",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="User-Centric Defaults",
-                    description="Set default options that benefit the user, not the business",
-                    source="D91 Labs",
-                    category="Ethics",
-                    priority=5
-                )
-            ],
-            FlowType.VISUAL: [
-                # Visual Cue Principles
-                UXPrinciple(
-                    name="High Visibility Filters",
-                    description="Use visual elements instead of text for filtering options",
-                    source="Meesho Tech",
-                    category="Navigation",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Visual Hierarchy",
-                    description="Place most important filters in first two positions",
-                    source="Meesho Tech",
-                    category="Layout",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Scroll Indicator",
-                    description="Use partial button to indicate more options available",
-                    source="Meesho Tech",
-                    category="Navigation",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Icon-Based Navigation",
-                    description="Use clear, intuitive icons that work without text",
-                    source="Meesho Tech",
-                    category="Visual Design",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Category Visualization",
-                    description="Use appropriate images for each category filter",
-                    source="Meesho Tech",
-                    category="Visual Design",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Dynamic Filtering",
-                    description="Show relevant filters based on user behavior",
-                    source="Meesho Tech",
-                    category="Personalization",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Filter Performance",
-                    description="Rank and fix filters based on their performance",
-                    source="Meesho Tech",
-                    category="Optimization",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Visual Consistency",
-                    description="Maintain consistent visual style across filters",
-                    source="Meesho Tech",
-                    category="Visual Design",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Screen Real Estate",
-                    description="Optimize use of screen space for maximum impact",
-                    source="Meesho Tech",
-                    category="Layout",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Progressive Disclosure",
-                    description="Show additional options through scrolling",
-                    source="Meesho Tech",
-                    category="Navigation",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Visual Feedback",
-                    description="Provide clear visual feedback for user actions",
-                    source="Meesho Tech",
-                    category="Interaction",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Cultural Relevance",
-                    description="Use visuals that resonate with local market",
-                    source="Meesho Tech",
-                    category="Localization",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Minimal Text",
-                    description="Reduce reliance on text-based instructions",
-                    source="Meesho Tech",
-                    category="Accessibility",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Visual Affordances",
-                    description="Make interactive elements visually obvious",
-                    source="Meesho Tech",
-                    category="Interaction",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Color and Contrast",
-                    description="Use high contrast and culturally appropriate colors",
-                    source="Meesho Tech",
-                    category="Visual Design",
-                    priority=4
-                )
-            ],
-            FlowType.PRICING: [
-                # Pricing Transparency Principles
-                UXPrinciple(
-                    name="Early Fee Disclosure",
-                    description="Display nonstandard fees and special charges on product pages",
-                    source="Nielsen Norman Group",
-                    category="Transparency",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Total Cost Visibility",
-                    description="Show complete cost including all fees before checkout",
-                    source="Nielsen Norman Group",
-                    category="Transparency",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Shipping Cost Calculator",
-                    description="Allow users to calculate shipping costs on product pages",
-                    source="Nielsen Norman Group",
-                    category="Functionality",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Fee Explanation",
-                    description="Clearly explain the purpose of each fee",
-                    source="Nielsen Norman Group",
-                    category="Transparency",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Prominent Fee Display",
-                    description="Place fee information near the product price",
-                    source="Nielsen Norman Group",
-                    category="Layout",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Progressive Disclosure",
-                    description="Show basic fees upfront, detailed breakdowns on demand",
-                    source="Nielsen Norman Group",
-                    category="Information Architecture",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="International Shipping Clarity",
-                    description="Clearly indicate international shipping costs and restrictions",
-                    source="Nielsen Norman Group",
-                    category="Transparency",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Special Delivery Notice",
-                    description="Highlight special delivery requirements and costs",
-                    source="Nielsen Norman Group",
-                    category="Transparency",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Fee Consistency",
-                    description="Maintain consistent fee terminology across the site",
-                    source="Nielsen Norman Group",
-                    category="Consistency",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Tax Estimation",
-                    description="Provide tax estimates based on location",
-                    source="Nielsen Norman Group",
-                    category="Functionality",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Bulk Pricing Clarity",
-                    description="Clearly show pricing for bulk or oversized items",
-                    source="Nielsen Norman Group",
-                    category="Transparency",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Service Fee Transparency",
-                    description="Explain service fees and their purpose",
-                    source="Nielsen Norman Group",
-                    category="Transparency",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Installation Cost Clarity",
-                    description="Show installation costs for applicable items",
-                    source="Nielsen Norman Group",
-                    category="Transparency",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Fee Breakdown",
-                    description="Provide detailed breakdown of all costs",
-                    source="Nielsen Norman Group",
-                    category="Transparency",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="No Hidden Costs",
-                    description="Avoid revealing significant costs only at checkout",
-                    source="Nielsen Norman Group",
-                    category="Ethics",
-                    priority=5
-                )
-            ],
-            FlowType.CONTENT: [
-                # UX Writing Principles
-                UXPrinciple(
-                    name="Clear Language",
-                    description="Use simple, straightforward language that users can easily understand",
-                    source="FinTech UX Writing",
-                    category="Clarity",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Concise Communication",
-                    description="Be direct and to the point, avoiding unnecessary complexity",
-                    source="FinTech UX Writing",
-                    category="Clarity",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Consistent Terminology",
-                    description="Maintain consistent terms and phrases throughout the interface",
-                    source="FinTech UX Writing",
-                    category="Consistency",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Jargon-Free Content",
-                    description="Avoid financial jargon and technical terms unless necessary",
-                    source="FinTech UX Writing",
-                    category="Accessibility",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Progressive Disclosure",
-                    description="Reveal complex information gradually as needed",
-                    source="FinTech UX Writing",
-                    category="Information Architecture",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Error Prevention",
-                    description="Provide clear instructions and warnings to prevent user errors",
-                    source="FinTech UX Writing",
-                    category="Error Handling",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Action-Oriented Text",
-                    description="Use verbs and active voice to guide user actions",
-                    source="FinTech UX Writing",
-                    category="Interaction",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Contextual Help",
-                    description="Provide relevant help text exactly when users need it",
-                    source="FinTech UX Writing",
-                    category="Support",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Brand Voice",
-                    description="Maintain consistent brand voice and tone across all content",
-                    source="FinTech UX Writing",
-                    category="Branding",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Accessible Content",
-                    description="Ensure content is readable by screen readers and assistive technologies",
-                    source="FinTech UX Writing",
-                    category="Accessibility",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Legal Compliance",
-                    description="Ensure all content meets regulatory and legal requirements",
-                    source="FinTech UX Writing",
-                    category="Compliance",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="User-Centric Language",
-                    description="Focus on user benefits and outcomes rather than features",
-                    source="FinTech UX Writing",
-                    category="User Focus",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Clear Error Messages",
-                    description="Provide specific, actionable error messages with solutions",
-                    source="FinTech UX Writing",
-                    category="Error Handling",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Progressive Complexity",
-                    description="Start with simple concepts and gradually introduce complexity",
-                    source="FinTech UX Writing",
-                    category="Learning",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Trust-Building Content",
-                    description="Use language that builds trust and confidence",
-                    source="FinTech UX Writing",
-                    category="Trust",
-                    priority=5
-                )
-            ],
-            FlowType.GAMIFICATION: [
-                # Core Gamification Principles
-                UXPrinciple(
-                    name="Reward System",
-                    description="Implement points, badges, and rewards for financial achievements",
-                    source="FinTech Gamification",
-                    category="Engagement",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Progress Visualization",
-                    description="Use progress bars and visual indicators to show financial goal progress",
-                    source="FinTech Gamification",
-                    category="Feedback",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Financial Challenges",
-                    description="Create engaging challenges and goals for saving and investing",
-                    source="FinTech Gamification",
-                    category="Motivation",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Educational Gamification",
-                    description="Use interactive quizzes and exercises to teach financial concepts",
-                    source="FinTech Gamification",
-                    category="Learning",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Social Competition",
-                    description="Implement leaderboards and social sharing for financial achievements",
-                    source="FinTech Gamification",
-                    category="Community",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Personalized Goals",
-                    description="Allow users to set and track personalized financial goals",
-                    source="FinTech Gamification",
-                    category="Personalization",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Instant Feedback",
-                    description="Provide immediate feedback for financial actions and achievements",
-                    source="FinTech Gamification",
-                    category="Feedback",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Tiered Rewards",
-                    description="Implement progressive reward levels based on user engagement",
-                    source="FinTech Gamification",
-                    category="Engagement",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Visual Progress",
-                    description="Use visual representations (like city building) for financial progress",
-                    source="FinTech Gamification",
-                    category="Visualization",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Daily Challenges",
-                    description="Offer daily financial tasks and challenges to maintain engagement",
-                    source="FinTech Gamification",
-                    category="Engagement",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Achievement Unlocking",
-                    description="Design progressive achievement system for financial milestones",
-                    source="FinTech Gamification",
-                    category="Motivation",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Community Features",
-                    description="Enable social interaction and community challenges",
-                    source="FinTech Gamification",
-                    category="Community",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Reward Store",
-                    description="Create a marketplace for redeeming earned points and rewards",
-                    source="FinTech Gamification",
-                    category="Engagement",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Financial Literacy Games",
-                    description="Develop interactive games for learning financial concepts",
-                    source="FinTech Gamification",
-                    category="Learning",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Savings Challenges",
-                    description="Implement competitive savings challenges with rewards",
-                    source="FinTech Gamification",
-                    category="Motivation",
-                    priority=5
-                )
-            ],
-            FlowType.CART: [
-                # Core Cart Abandonment Prevention Principles
-                UXPrinciple(
-                    name="Progressive Profiling",
-                    description="Collect customer information gradually over multiple visits",
-                    source="E-commerce Best Practices",
-                    category="Data Collection",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="One-Page Checkout",
-                    description="Consolidate checkout process into a single page",
-                    source="E-commerce Best Practices",
-                    category="Efficiency",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="One-Click Checkout",
-                    description="Enable instant checkout for returning customers",
-                    source="E-commerce Best Practices",
-                    category="Efficiency",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Cost Transparency",
-                    description="Display all costs and fees upfront",
-                    source="E-commerce Best Practices",
-                    category="Trust",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Mobile Optimization",
-                    description="Optimize checkout for mobile devices with clear CTAs",
-                    source="E-commerce Best Practices",
-                    category="Accessibility",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Guest Checkout",
-                    description="Allow purchases without account creation",
-                    source="E-commerce Best Practices",
-                    category="Accessibility",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Trust Signals",
-                    description="Display security badges and payment method icons",
-                    source="E-commerce Best Practices",
-                    category="Trust",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Payment Options",
-                    description="Offer multiple payment methods including digital wallets",
-                    source="E-commerce Best Practices",
-                    category="Flexibility",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Cross-Channel Consistency",
-                    description="Maintain consistent checkout experience across all channels",
-                    source="E-commerce Best Practices",
-                    category="Consistency",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Checkout Analytics",
-                    description="Track and analyze checkout metrics for optimization",
-                    source="E-commerce Best Practices",
-                    category="Analytics",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Fraud Prevention",
-                    description="Implement robust fraud detection without hindering legitimate purchases",
-                    source="E-commerce Best Practices",
-                    category="Security",
-                    priority=5
-                ),
-                UXPrinciple(
-                    name="Omnichannel Checkout",
-                    description="Enable checkout on all customer touchpoints",
-                    source="E-commerce Best Practices",
-                    category="Accessibility",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Cart Recovery",
-                    description="Implement automated cart recovery emails with incentives",
-                    source="E-commerce Best Practices",
-                    category="Retention",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Personalized Recommendations",
-                    description="Show relevant product recommendations during checkout",
-                    source="E-commerce Best Practices",
-                    category="Personalization",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Post-Purchase Engagement",
-                    description="Maintain engagement after purchase with updates and reviews",
-                    source="E-commerce Best Practices",
-                    category="Retention",
-                    priority=4
-                ),
-                UXPrinciple(
-                    name="Loyalty Integration",
-                    description="Integrate loyalty programs into checkout process",
-                    source="E-commerce Best Practices",
-                    category="Retention",
-                    priority=4
-                )
-            ]
-        }
-
-    def get_principles_for_flow(self, flow_type: FlowType) -> List[UXPrinciple]:
+        if hasattr(self, "_prompt_cache"):
+            return  # Shared instance, already initialized
+        self.principles: Mapping[FlowType, Tuple[UXPrinciple, ...]] = _PRINCIPLES_DATA
+
+        # Formatted prompt context per flow, filled on first request
+        self._prompt_cache: Dict[FlowType, str] = {}
+
+    def get_principles_for_flow(self, flow_type: Union[FlowType, str]) -> Sequence[UXPrinciple]:
         """Get all principles for a specific flow type."""
-        return (self.principles.get(flow_type, []) + 
-                self.principles.get(FlowType.GENERAL, []) + 
-                self.principles.get(FlowType.ETHICAL, []) +
-                self.principles.get(FlowType.VISUAL, []) +
-                self.principles.get(FlowType.PRICING, []) +
-                self.principles.get(FlowType.CONTENT, []) +
-                self.principles.get(FlowType.GAMIFICATION, []) +
-                self.principles.get(FlowType.CART, []))
-
-    def get_high_priority_principles(self, flow_type: FlowType) -> List[UXPrinciple]:
+        return _merged(_resolve(flow_type))
+
+    def get_high_priority_principles(self, flow_type: Union[FlowType, str]) -> Sequence[UXPrinciple]:
         """Get high priority principles (priority >= 4) for a specific flow type."""
-        flow_principles = self.principles.get(flow_type, [])
-        general_principles = self.principles.get(FlowType.GENERAL, [])
-        ethical_principles = self.principles.get(FlowType.ETHICAL, [])
-        visual_principles = self.principles.get(FlowType.VISUAL, [])
-        pricing_principles = self.principles.get(FlowType.PRICING, [])
-        content_principles = self.principles.get(FlowType.CONTENT, [])
-        gamification_principles = self.principles.get(FlowType.GAMIFICATION, [])
-        cart_principles = self.principles.get(FlowType.CART, [])
-        return [p for p in flow_principles + general_principles + ethical_principles + visual_principles + pricing_principles + content_principles + gamification_principles + cart_principles if p.priority >= 4]
-
-    def get_principles_by_category(self, flow_type: FlowType, category: str) -> List[UXPrinciple]:
+        return _high_pri(_resolve(flow_type))
+
+    def get_principles_by_category(self, flow_type: Union[FlowType, str], category: str) -> Sequence[UXPrinciple]:
         """Get principles for a specific flow type and category."""
-        flow_principles = self.principles.get(flow_type, [])
-        general_principles = self.principles.get(FlowType.GENERAL, [])
-        ethical_principles = self.principles.get(FlowType.ETHICAL, [])
-        visual_principles = self.principles.get(FlowType.VISUAL, [])
-        pricing_principles = self.principles.get(FlowType.PRICING, [])
-        content_principles = self.principles.get(FlowType.CONTENT, [])
-        gamification_principles = self.principles.get(FlowType.GAMIFICATION, [])
-        cart_principles = self.principles.get(FlowType.CART, [])
-        return [p for p in flow_principles + general_principles + ethical_principles + visual_principles + pricing_principles + content_principles + gamification_principles + cart_principles if p.category == category]
-
-    def generate_prompt_context(self, flow_type: FlowType) -> str:
+        return _by_cat(_resolve(flow_type)).get(sys.intern(category), _EMPTY)
+
+    def generate_prompt_context(self, flow_type: Union[FlowType, str]) -> str:
         """Generate a prompt context string with relevant principles."""
-        principles = self.get_high_priority_principles(flow_type)
-        context = f"UX Principles for {flow_type.value} flow:\n\n"
-        
-        # Group principles by category
-        categories = {}
-        for principle in principles:
-            if principle.category not in categories:
-                categories[principle.category] = []
-            categories[principle.category].append(principle)
+        flow_type = _resolve(flow_type)
+        context = self._prompt_cache.get(flow_type)
+        if context is not None:
+            return context
+
+        parts = [f"UX Principles for {flow_type.label} flow:\n\n"]
         
         # Format by category
-        for category, principles in categories.items():
-            context += f"\n{category}:\n"
-            for principle in principles:
-                context += f"- {principle.name}: {principle.description} (Priority: {principle.priority})\n"
+        for category, principles in _grouped_high_pri(flow_type):
+            parts.append(f"\n{category}:\n")
+            parts.extend(f"- {p.name}: {p.description} (Priority: {p.priority})\n" for p in principles)
         
-        return context 
\ No newline at end of file
+        context = self._prompt_cache[flow_type] = "".join(parts)
+        return context
+